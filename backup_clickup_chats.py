@@ -14,14 +14,33 @@ Saves data in both JSON and CSV formats.
 """
 
 import argparse
-import requests
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
 import json
 import csv
+import io
 import os
+import re
+import shutil
 import time
 import sys
+from collections import defaultdict, deque
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from dotenv import load_dotenv
+from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
+
+try:
+    import orjson  # optional, much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # optional, needed for --compress
+except ImportError:
+    zstandard = None
 
 # Load .env file from script directory
 load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
@@ -33,12 +52,38 @@ BASE_URL_V2 = "https://api.clickup.com/api/v2"
 BASE_URL_V3 = "https://api.clickup.com/api/v3"
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backups")
-RATE_LIMIT_DELAY = 1.0  # seconds between API calls
+RATE_LIMIT_PER_MINUTE = 100  # ClickUp's per-token limit on most plans
 MAX_RETRIES = 3
+MAX_CONCURRENCY = 8  # channels fetched in parallel
+HTTP_POOL_SIZE = 16  # max open connections to the API
+CSV_BATCH_SIZE = 1024  # rows buffered per writerows() call
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB file buffer for exports
+ZSTD_LEVEL = 3  # fast, still shrinks JSON/CSV exports several-fold
+MS_TIMESTAMP_THRESHOLD = 10 ** 12  # larger timestamps are in milliseconds
+CHECKPOINT_FILE = "checkpoint.jsonl"  # resume state inside a backup's .spool dir
+
+# Shared HTTP session, opened in run_backup() once the token is known
+SESSION = None
+
+# Request budget shared by all concurrent fetches (token bucket)
+LIMITER = AsyncLimiter(RATE_LIMIT_PER_MINUTE, 60)
+
+# Monotonic time before which no new request is sent, set when the server
+# reports the current rate-limit window as exhausted
+RATE_LIMIT_RESUME_AT = 0.0
+
+# Write exports as zstd-compressed .zst files (set from --compress)
+COMPRESS = False
 
 
 # ─── API Helpers ─────────────────────────────────────────────────────────────
 
+def set_api_token(token):
+    """Use the given API token for the session opened by run_backup()."""
+    global API_TOKEN
+    API_TOKEN = token
+
+
 def get_headers():
     return {
         "Authorization": API_TOKEN,
@@ -46,61 +91,139 @@ def get_headers():
     }
 
 
-def api_get(url, params=None, retries=0):
+def load_json(raw):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(data, indent=False):
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False, default=str,
+    ).encode("utf-8")
+
+
+def pause_requests(seconds):
+    """Hold back every new request for the given number of seconds."""
+    global RATE_LIMIT_RESUME_AT
+    RATE_LIMIT_RESUME_AT = max(RATE_LIMIT_RESUME_AT, time.monotonic() + seconds)
+
+
+async def wait_for_pause():
+    """Sleep until the shared rate-limit pause is over, even if it is extended meanwhile."""
+    while True:
+        pause = RATE_LIMIT_RESUME_AT - time.monotonic()
+        if pause <= 0:
+            return
+        await asyncio.sleep(pause)
+
+
+def seconds_until_reset(headers):
+    """Seconds until the X-RateLimit-Reset epoch, or None if the header is missing."""
+    reset = headers.get("X-RateLimit-Reset")
+    if reset and reset.isdigit():
+        return max(0, int(reset) - time.time())
+    return None
+
+
+def note_rate_limit(headers):
+    """Pause all requests until the window resets once the server says it is used up."""
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset_in = seconds_until_reset(headers)
+        if reset_in is not None:
+            pause_requests(reset_in)
+
+
+class FetchError(Exception):
+    """A page could not be fetched, so the data collected so far is partial."""
+
+
+async def api_get(url, params=None):
     """Make a GET request with rate limiting, retries, and error handling."""
-    time.sleep(RATE_LIMIT_DELAY)
-    try:
-        resp = requests.get(url, headers=get_headers(), params=params, timeout=30)
-        if resp.status_code == 429:
-            retry_after = int(resp.headers.get("Retry-After", 5))
-            print(f"  Rate limited. Waiting {retry_after}s...")
-            time.sleep(retry_after)
-            return api_get(url, params)
-        if resp.status_code == 401:
-            print("  ERROR: Invalid API token. Check your CLICKUP_API_TOKEN.")
-            sys.exit(1)
-        if resp.status_code != 200:
-            print(f"  API error {resp.status_code}: {resp.text[:200]}")
-            return None
-        return resp.json()
-    except requests.exceptions.RequestException as e:
-        if retries < MAX_RETRIES:
+    retries = 0
+    while True:
+        await wait_for_pause()
+        try:
+            async with LIMITER:
+                # Requests that were already queued in the limiter must also
+                # honour a pause set by another task's 429
+                await wait_for_pause()
+                async with SESSION.get(url, params=params) as resp:
+                    headers = resp.headers
+                    note_rate_limit(headers)
+                    if resp.status == 401:
+                        tqdm.write("  ERROR: Invalid API token. Check your CLICKUP_API_TOKEN.")
+                        sys.exit(1)
+                    if resp.status == 200:
+                        return load_json(await resp.read())
+                    if resp.status != 429:
+                        text = await resp.text()
+                        tqdm.write(f"  API error {resp.status}: {text[:200]}")
+                        return None
+                    if retries >= MAX_RETRIES:
+                        tqdm.write(f"  Still rate limited after {MAX_RETRIES} retries, giving up.")
+                        return None
+                    # Prefer the server's hints over guessing: Retry-After, then
+                    # the window reset time. Exponential backoff is the floor, so
+                    # a reset time already in the past (clock skew, or the window
+                    # just rolled over) cannot burn the retries in a tight loop
+                    retry_after = headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        wait = int(retry_after)
+                    else:
+                        wait = seconds_until_reset(headers) or 0
+                    wait = max(wait, 2 ** (retries + 1))
+                    pause_requests(wait)
+                    tqdm.write(
+                        f"  Rate limited. Waiting {wait:.0f}s... ({retries + 1}/{MAX_RETRIES})"
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # ValueError covers malformed or truncated JSON bodies (both
+            # orjson and stdlib decode errors subclass it)
+            if retries >= MAX_RETRIES:
+                tqdm.write(f"  Request failed after {MAX_RETRIES} retries: {e}")
+                return None
             wait = 2 ** (retries + 1)
-            print(f"  Connection error, retrying in {wait}s... ({retries + 1}/{MAX_RETRIES})")
-            time.sleep(wait)
-            return api_get(url, params, retries + 1)
-        print(f"  Request failed after {MAX_RETRIES} retries: {e}")
-        return None
+            tqdm.write(f"  Request error, retrying in {wait}s... ({retries + 1}/{MAX_RETRIES})")
+
+        retries += 1
+        await asyncio.sleep(wait)
 
 
 # ─── Workspace / Team ────────────────────────────────────────────────────────
 
-def get_teams():
+async def get_teams():
     """Get all workspaces (teams) the user has access to."""
-    data = api_get(f"{BASE_URL_V2}/team")
+    data = await api_get(f"{BASE_URL_V2}/team")
     if data and "teams" in data:
         return data["teams"]
     return []
 
 
-def get_workspace_members(team_id):
-    """Get all members in a workspace to resolve DM names."""
-    data = api_get(f"{BASE_URL_V2}/team/{team_id}")
-    members = {}
+async def get_workspace_members(team_id):
+    """Get all members in a workspace to resolve DM names.
+
+    Returns two flat dicts keyed by user id: names and emails.
+    """
+    data = await api_get(f"{BASE_URL_V2}/team/{team_id}")
+    member_names = {}
+    member_emails = {}
     if data and "team" in data:
         for member in data["team"].get("members", []):
             user = member.get("user", {})
             uid = str(user.get("id", ""))
-            members[uid] = {
-                "name": user.get("username", user.get("initials", "Unknown")),
-                "email": user.get("email", ""),
-            }
-    return members
+            member_names[uid] = user.get("username", user.get("initials", "Unknown"))
+            member_emails[uid] = user.get("email", "")
+    return member_names, member_emails
 
 
-def select_workspace(workspace_id=None):
+async def select_workspace(workspace_id=None):
     """Let user select a workspace, or auto-select if ID is provided."""
-    teams = get_teams()
+    teams = await get_teams()
     if not teams:
         print("No workspaces found. Check your API token.")
         sys.exit(1)
@@ -134,63 +257,63 @@ def select_workspace(workspace_id=None):
 
 # ─── Legacy Chat Views (v2 API) ─────────────────────────────────────────────
 
-def get_spaces(team_id):
+async def get_spaces(team_id):
     """Get all spaces in a workspace."""
-    data = api_get(f"{BASE_URL_V2}/team/{team_id}/space", params={"archived": "false"})
+    data = await api_get(f"{BASE_URL_V2}/team/{team_id}/space", params={"archived": "false"})
     if data and "spaces" in data:
         return data["spaces"]
     return []
 
 
-def get_folders(space_id):
+async def get_folders(space_id):
     """Get all folders in a space."""
-    data = api_get(f"{BASE_URL_V2}/space/{space_id}/folder", params={"archived": "false"})
+    data = await api_get(f"{BASE_URL_V2}/space/{space_id}/folder", params={"archived": "false"})
     if data and "folders" in data:
         return data["folders"]
     return []
 
 
-def get_views_for_space(space_id):
+async def get_views_for_space(space_id):
     """Get all views in a space."""
-    data = api_get(f"{BASE_URL_V2}/space/{space_id}/view")
+    data = await api_get(f"{BASE_URL_V2}/space/{space_id}/view")
     if data and "views" in data:
         return data["views"]
     return []
 
 
-def get_views_for_folder(folder_id):
+async def get_views_for_folder(folder_id):
     """Get all views in a folder."""
-    data = api_get(f"{BASE_URL_V2}/folder/{folder_id}/view")
+    data = await api_get(f"{BASE_URL_V2}/folder/{folder_id}/view")
     if data and "views" in data:
         return data["views"]
     return []
 
 
-def get_views_for_list(list_id):
+async def get_views_for_list(list_id):
     """Get all views in a list."""
-    data = api_get(f"{BASE_URL_V2}/list/{list_id}/view")
+    data = await api_get(f"{BASE_URL_V2}/list/{list_id}/view")
     if data and "views" in data:
         return data["views"]
     return []
 
 
-def get_lists_for_folder(folder_id):
+async def get_lists_for_folder(folder_id):
     """Get all lists in a folder."""
-    data = api_get(f"{BASE_URL_V2}/folder/{folder_id}/list", params={"archived": "false"})
+    data = await api_get(f"{BASE_URL_V2}/folder/{folder_id}/list", params={"archived": "false"})
     if data and "lists" in data:
         return data["lists"]
     return []
 
 
-def get_folderless_lists(space_id):
+async def get_folderless_lists(space_id):
     """Get lists not in a folder."""
-    data = api_get(f"{BASE_URL_V2}/space/{space_id}/list", params={"archived": "false"})
+    data = await api_get(f"{BASE_URL_V2}/space/{space_id}/list", params={"archived": "false"})
     if data and "lists" in data:
         return data["lists"]
     return []
 
 
-def get_chat_view_comments(view_id):
+async def get_chat_view_comments(view_id):
     """Get ALL comments from a chat view (handles pagination)."""
     all_comments = []
     start = None
@@ -203,13 +326,12 @@ def get_chat_view_comments(view_id):
         if start_id is not None:
             params["start_id"] = start_id
 
-        data = api_get(f"{BASE_URL_V2}/view/{view_id}/comment", params=params)
+        data = await api_get(f"{BASE_URL_V2}/view/{view_id}/comment", params=params)
         if not data or "comments" not in data or len(data["comments"]) == 0:
             break
 
         comments = data["comments"]
         all_comments.extend(comments)
-        print(f"    Fetched {len(all_comments)} comments so far...")
 
         if len(comments) < 25:
             break
@@ -224,148 +346,147 @@ def get_chat_view_comments(view_id):
     return all_comments
 
 
-def find_all_chat_views(team_id):
-    """Discover all chat views across all spaces, folders, and lists."""
+def _chat_views(views, location):
+    """Pick the chat views out of a list of views."""
+    return [
+        {
+            "view_id": v["id"],
+            "view_name": v.get("name", "Unnamed"),
+            "location": location,
+        }
+        for v in views
+        if v.get("type") == "chat"
+    ]
+
+
+async def _find_list_chat_views(lists, location):
+    """Discover chat views on each list, all lists at once."""
+    all_views = await asyncio.gather(*(get_views_for_list(lst["id"]) for lst in lists))
     chat_views = []
-    spaces = get_spaces(team_id)
-    print(f"\nFound {len(spaces)} space(s)")
+    for lst, views in zip(lists, all_views):
+        chat_views.extend(_chat_views(views, f"{location} > List: {lst['name']}"))
+    return chat_views
 
-    for space in spaces:
-        space_name = space["name"]
-        space_id = space["id"]
-        print(f"\n  Scanning space: {space_name}")
-
-        # Views at space level
-        views = get_views_for_space(space_id)
-        for v in views:
-            if v.get("type") == "chat":
-                chat_views.append({
-                    "view_id": v["id"],
-                    "view_name": v.get("name", "Unnamed"),
-                    "location": f"Space: {space_name}",
-                })
-
-        # Folders in space
-        folders = get_folders(space_id)
-        for folder in folders:
-            folder_name = folder["name"]
-            folder_id = folder["id"]
-
-            views = get_views_for_folder(folder_id)
-            for v in views:
-                if v.get("type") == "chat":
-                    chat_views.append({
-                        "view_id": v["id"],
-                        "view_name": v.get("name", "Unnamed"),
-                        "location": f"Space: {space_name} > Folder: {folder_name}",
-                    })
 
-            lists = get_lists_for_folder(folder_id)
-            for lst in lists:
-                list_name = lst["name"]
-                list_id = lst["id"]
-                views = get_views_for_list(list_id)
-                for v in views:
-                    if v.get("type") == "chat":
-                        chat_views.append({
-                            "view_id": v["id"],
-                            "view_name": v.get("name", "Unnamed"),
-                            "location": f"Space: {space_name} > Folder: {folder_name} > List: {list_name}",
-                        })
-
-        # Folderless lists
-        lists = get_folderless_lists(space_id)
-        for lst in lists:
-            list_name = lst["name"]
-            list_id = lst["id"]
-            views = get_views_for_list(list_id)
-            for v in views:
-                if v.get("type") == "chat":
-                    chat_views.append({
-                        "view_id": v["id"],
-                        "view_name": v.get("name", "Unnamed"),
-                        "location": f"Space: {space_name} > List: {list_name}",
-                    })
+async def _find_folder_chat_views(folder, space_name):
+    """Discover chat views in a folder and its lists."""
+    location = f"Space: {space_name} > Folder: {folder['name']}"
+    views, lists = await asyncio.gather(
+        get_views_for_folder(folder["id"]),
+        get_lists_for_folder(folder["id"]),
+    )
+    return _chat_views(views, location) + await _find_list_chat_views(lists, location)
+
 
+async def _find_space_chat_views(space):
+    """Discover chat views in a space, its folders, and its lists."""
+    space_name = space["name"]
+    space_id = space["id"]
+    print(f"\n  Scanning space: {space_name}")
+
+    views, folders, lists = await asyncio.gather(
+        get_views_for_space(space_id),
+        get_folders(space_id),
+        get_folderless_lists(space_id),
+    )
+    folder_views, list_views = await asyncio.gather(
+        asyncio.gather(*(_find_folder_chat_views(folder, space_name) for folder in folders)),
+        _find_list_chat_views(lists, f"Space: {space_name}"),
+    )
+
+    chat_views = _chat_views(views, f"Space: {space_name}")
+    for found in folder_views:
+        chat_views.extend(found)
+    chat_views.extend(list_views)
     return chat_views
 
 
+async def find_all_chat_views(team_id):
+    """Discover all chat views across all spaces, folders, and lists."""
+    spaces = await get_spaces(team_id)
+    print(f"\nFound {len(spaces)} space(s)")
+
+    # Spaces, folders, and lists are scanned concurrently; gather keeps the
+    # results in hierarchy order
+    per_space = await asyncio.gather(*(_find_space_chat_views(space) for space in spaces))
+    return [cv for chat_views in per_space for cv in chat_views]
+
+
 # ─── New Chat Channels & Messages (v3 API) ──────────────────────────────────
 
-def get_all_channels(workspace_id):
+async def get_all_channels(workspace_id):
     """Get chat channels the user follows, plus all DMs and Group DMs (including closed)."""
-    all_channels = []
-    seen_ids = set()
-
-    # Fetch only channels the user follows + all DMs/Group DMs (including closed)
-    for include_closed in ["false", "true"]:
-        cursor = None
-        while True:
-            params = {
-                "limit": 100,
-                "is_follower": "true",
-                "include_closed": include_closed,
-            }
-            if cursor:
-                params["cursor"] = cursor
-
-            data = api_get(
-                f"{BASE_URL_V3}/workspaces/{workspace_id}/chat/channels",
-                params=params,
-            )
-            if not data or "data" not in data:
-                break
+    all_channels = {}
+    cursor = None
+
+    # Fetch only channels the user follows + all DMs/Group DMs. Closed
+    # conversations are included alongside open ones, so one pass suffices.
+    while True:
+        params = {
+            "limit": 100,
+            "is_follower": "true",
+            "include_closed": "true",
+        }
+        if cursor:
+            params["cursor"] = cursor
 
-            channels = data["data"]
-            for ch in channels:
-                if ch["id"] not in seen_ids:
-                    seen_ids.add(ch["id"])
-                    all_channels.append(ch)
+        data = await api_get(
+            f"{BASE_URL_V3}/workspaces/{workspace_id}/chat/channels",
+            params=params,
+        )
+        if not data or "data" not in data:
+            break
 
-            print(f"  Fetched {len(all_channels)} unique channels so far... (include_closed={include_closed})")
+        for ch in data["data"]:
+            all_channels.setdefault(ch["id"], ch)
 
-            next_cursor = data.get("next_cursor")
-            if not next_cursor:
-                break
-            cursor = next_cursor
+        print(f"  Fetched {len(all_channels)} unique channels so far...")
 
-    return all_channels
+        next_cursor = data.get("next_cursor")
+        if not next_cursor:
+            break
+        cursor = next_cursor
 
+    return list(all_channels.values())
 
-def get_channel_messages(workspace_id, channel_id):
-    """Get ALL messages from a chat channel."""
-    all_messages = []
-    cursor = None
 
+async def iter_channel_messages(workspace_id, channel_id, cursor=None):
+    """Yield ALL messages from a chat channel, one page at a time.
+
+    Each item is a (messages, next_cursor) pair; next_cursor is None on the
+    last page. Pass a cursor to continue from a previously seen page. Raises
+    FetchError if a page cannot be fetched, so a failed request is never
+    mistaken for the end of the channel.
+    """
     while True:
         params = {"limit": 100}
         if cursor:
             params["cursor"] = cursor
 
-        data = api_get(
+        data = await api_get(
             f"{BASE_URL_V3}/workspaces/{workspace_id}/chat/channels/{channel_id}/messages",
             params=params,
         )
-        if not data:
-            break
+        if data is None:
+            raise FetchError(f"could not fetch messages of channel {channel_id}")
 
         messages = data.get("data", data.get("messages", []))
         if not messages:
             break
 
-        all_messages.extend(messages)
-        print(f"    Fetched {len(all_messages)} messages so far...")
-
         next_cursor = data.get("next_cursor")
+        yield messages, next_cursor
+
         if not next_cursor:
             break
         cursor = next_cursor
 
-    return all_messages
 
+async def get_message_replies(workspace_id, channel_id, message_id):
+    """Get all replies/threads for a specific message.
 
-def get_message_replies(workspace_id, channel_id, message_id):
-    """Get all replies/threads for a specific message."""
+    Raises FetchError if a page of replies cannot be fetched.
+    """
     all_replies = []
     cursor = None
 
@@ -374,12 +495,12 @@ def get_message_replies(workspace_id, channel_id, message_id):
         if cursor:
             params["cursor"] = cursor
 
-        data = api_get(
+        data = await api_get(
             f"{BASE_URL_V3}/workspaces/{workspace_id}/chat/channels/{channel_id}/messages/{message_id}/replies",
             params=params,
         )
-        if not data:
-            break
+        if data is None:
+            raise FetchError(f"could not fetch replies to message {message_id}")
 
         replies = data.get("data", data.get("replies", []))
         if not replies:
@@ -395,50 +516,71 @@ def get_message_replies(workspace_id, channel_id, message_id):
     return all_replies
 
 
-def resolve_channel_name(channel, members):
+def get_reply_count(msg):
+    """Return a message's thread reply count as an int (0 if missing or malformed)."""
+    reply_count = msg.get("reply_count", 0) or 0
+    if isinstance(reply_count, str):
+        return int(reply_count) if reply_count.isdigit() else 0
+    return reply_count
+
+
+def resolve_channel_name(channel, member_names):
     """Resolve a friendly name for DM channels using member info."""
     ch_name = channel.get("name", "")
     ch_type = channel.get("type", "")
 
-    if ch_name and ch_type == "CHANNEL":
-        return ch_name
-
-    # For DMs, try to build name from members
+    # Regular channels always use their own name; only DMs need members
     if ch_type in ("DM", "GROUP_DM"):
         member_links = channel.get("member_links", channel.get("members", []))
-        names = []
-        for m in member_links:
-            uid = str(m.get("user_id", m.get("id", "")))
-            if uid in members:
-                names.append(members[uid]["name"])
-        if names:
-            return f"DM: {' & '.join(names)}"
+        if member_links:
+            # Links carry either "user_id" or "id"; check the schema once
+            key = "user_id" if "user_id" in member_links[0] else "id"
+            names = []
+            for m in member_links:
+                uid = str(m.get(key, ""))
+                if uid in member_names:
+                    names.append(member_names[uid])
+            if names:
+                return f"DM: {' & '.join(names)}"
 
     return ch_name if ch_name else f"channel-{channel.get('id', 'unknown')}"
 
 
 # ─── User Resolution ─────────────────────────────────────────────────────────
 
-def enrich_message_with_user(msg, members):
-    """Add user_name and user_email fields to a message based on user_id."""
+def enrich_message_with_user(msg, member_names, member_emails, user_cache=None):
+    """Add user_name and user_email fields to a message based on user_id.
+
+    If given, user_cache maps user_id to the resolved (name, email) pair and
+    is reused across calls, so each poster is only resolved once.
+    """
     uid = str(msg.get("user_id", ""))
-    if uid and uid in members:
-        msg["user_name"] = members[uid]["name"]
-        msg["user_email"] = members[uid]["email"]
+    if uid and user_cache is not None and uid in user_cache:
+        msg["user_name"], msg["user_email"] = user_cache[uid]
+        return msg
+
+    if uid and uid in member_names:
+        msg["user_name"] = member_names[uid]
+        msg["user_email"] = member_emails[uid]
     else:
         # Fallback: try creator/user dict if present
         user = msg.get("creator", msg.get("user", {})) or {}
         msg["user_name"] = user.get("username", user.get("name", f"user_{uid}" if uid else "Unknown"))
         msg["user_email"] = user.get("email", "")
+
+    if uid and user_cache is not None:
+        user_cache[uid] = (msg["user_name"], msg["user_email"])
     return msg
 
 
-def enrich_messages(messages, members):
+def enrich_messages(messages, member_names, member_emails, user_cache=None):
     """Enrich all messages (and their replies) with user name/email."""
+    if user_cache is None:
+        user_cache = {}
     for msg in messages:
-        enrich_message_with_user(msg, members)
+        enrich_message_with_user(msg, member_names, member_emails, user_cache)
         for reply in msg.get("replies", []):
-            enrich_message_with_user(reply, members)
+            enrich_message_with_user(reply, member_names, member_emails, user_cache)
     return messages
 
 
@@ -446,18 +588,16 @@ def enrich_messages(messages, members):
 
 def extract_text(content):
     """Extract plain text from various message content formats."""
+    if type(content) is str:
+        return content
     if content is None:
         return ""
-    if isinstance(content, str):
-        return content
     if isinstance(content, list):
-        parts = []
-        for item in content:
-            if isinstance(item, dict):
-                parts.append(item.get("text", ""))
-            elif isinstance(item, str):
-                parts.append(item)
-        return "".join(parts)
+        return "".join([
+            item.get("text", "") if isinstance(item, dict) else item
+            for item in content
+            if isinstance(item, (dict, str))
+        ])
     if isinstance(content, dict):
         return content.get("text", content.get("plain_text", json.dumps(content)))
     return str(content)
@@ -468,84 +608,180 @@ def format_timestamp(ts):
     if not ts:
         return ""
     try:
-        ts_val = int(ts) / 1000 if int(ts) > 1e12 else int(ts)
-        return datetime.fromtimestamp(ts_val).strftime("%Y-%m-%d %H:%M:%S")
+        ts_val = int(ts)
+        if ts_val > MS_TIMESTAMP_THRESHOLD:
+            ts_val //= 1000
+        return datetime.fromtimestamp(ts_val).isoformat(" ", "seconds")
     except (ValueError, OSError):
         return str(ts)
 
 
-def save_json(data, filepath):
-    """Save data as formatted JSON."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+@contextmanager
+def open_for_write(filepath, mode, compress=None, **kwargs):
+    """Open a buffered temp file beside filepath and move it into place on success.
+
+    Readers never see a half-written export, and a failed run leaves any
+    previous file untouched. When compressing (COMPRESS unless overridden),
+    the output is zstd-compressed and ".zst" is appended to the file name.
+    """
+    if compress is None:
+        compress = COMPRESS
+    if compress:
+        filepath += ".zst"
+    tmp_path = filepath + ".tmp"
+    try:
+        with ExitStack() as stack:
+            if compress:
+                raw = stack.enter_context(open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE))
+                cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+                f = stack.enter_context(cctx.stream_writer(raw, closefd=False))
+                if "b" not in mode:
+                    f = stack.enter_context(io.TextIOWrapper(f, **kwargs))
+            else:
+                f = stack.enter_context(
+                    open(tmp_path, mode, buffering=WRITE_BUFFER_SIZE, **kwargs)
+                )
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     print(f"  Saved: {filepath}")
 
 
+def save_json(data, filepath, compress=None):
+    """Save data as formatted JSON."""
+    with open_for_write(filepath, "wb", compress=compress) as f:
+        f.write(dump_json(data, indent=True))
+
+
+def _indent_json(raw, width):
+    """Indent serialized multi-line JSON so it can be nested in an outer document."""
+    pad = b" " * width
+    return pad + raw.replace(b"\n", b"\n" + pad)
+
+
+def save_json_stream(items, filepath, stream_key=None):
+    """Save an iterable as a JSON array, serializing one item at a time.
+
+    If stream_key is given, that field of each item may be any iterable; it
+    is written element by element as the item's last field, so it never has
+    to be held in memory as a whole.
+    """
+    with open_for_write(filepath, "wb") as f:
+        sep = b"[\n"
+        for item in items:
+            f.write(sep)
+            sep = b",\n"
+            if stream_key is None:
+                f.write(_indent_json(dump_json(item, indent=True), 2))
+                continue
+
+            item = dict(item)
+            values = item.pop(stream_key)
+            head = _indent_json(dump_json(item, indent=True), 2)
+            # Reopen the serialized object ("...\n  }") to append the field
+            f.write(head[:-4] + b",\n" if item else b"  {\n")
+            f.write(b'    "' + stream_key.encode() + b'": [')
+            inner = b"\n"
+            for value in values:
+                f.write(inner)
+                f.write(_indent_json(dump_json(value, indent=True), 6))
+                inner = b",\n"
+            f.write(b"\n    ]\n  }" if inner != b"\n" else b"]\n  }")
+        f.write(b"\n]" if sep != b"[\n" else b"[]")
+
+
+def iter_jsonl(filepath):
+    """Yield one decoded record per line of a JSON Lines file."""
+    with open(filepath, "rb") as f:
+        for line in f:
+            yield load_json(line)
+
+
 def save_chat_views_csv(all_view_data, filepath):
     """Save chat view comments as CSV."""
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
+    with open_for_write(filepath, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow([
             "View Name", "Location", "Comment ID", "Date", "User",
             "User Email", "Message Text", "Resolved", "Reply Count",
         ])
+        user_cache = {}
+        rows = []
         for view_info in all_view_data:
             for comment in view_info.get("comments", []):
                 user = comment.get("user", {}) or {}
-                writer.writerow([
+                uid = user.get("id")
+                user_fields = user_cache.get(uid)
+                if user_fields is None:
+                    user_fields = (user.get("username", user.get("initials", "")), user.get("email", ""))
+                    if uid is not None:
+                        user_cache[uid] = user_fields
+                rows.append((
                     view_info.get("view_name", ""),
                     view_info.get("location", ""),
                     comment.get("id", ""),
                     format_timestamp(comment.get("date")),
-                    user.get("username", user.get("initials", "")),
-                    user.get("email", ""),
+                    *user_fields,
                     extract_text(comment.get("comment", comment.get("comment_text", ""))),
                     comment.get("resolved", ""),
                     comment.get("reply_count", "0"),
-                ])
-    print(f"  Saved: {filepath}")
+                ))
+                if len(rows) >= CSV_BATCH_SIZE:
+                    writer.writerows(rows)
+                    rows.clear()
+        writer.writerows(rows)
 
 
 def save_channels_csv(all_channel_data, filepath):
     """Save chat channel messages as CSV."""
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
+    with open_for_write(filepath, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow([
             "Channel Name", "Channel Type", "Message ID", "Date",
             "User", "User Email", "Message Text", "Is Reply",
             "Parent Message ID", "Reactions", "Attachments",
         ])
+        rows = []
         for ch_info in all_channel_data:
             ch_name = ch_info.get("channel_name", "")
             ch_type = ch_info.get("channel_type", "")
 
             for msg in ch_info.get("messages", []):
-                _write_message_row(writer, ch_name, ch_type, msg, is_reply=False)
+                rows.append(_message_row(ch_name, ch_type, msg, is_reply=False))
 
                 # Write replies as sub-rows
                 for reply in msg.get("replies", []):
-                    _write_message_row(
-                        writer, ch_name, ch_type, reply,
+                    rows.append(_message_row(
+                        ch_name, ch_type, reply,
                         is_reply=True, parent_id=msg.get("id", ""),
-                    )
-    print(f"  Saved: {filepath}")
+                    ))
 
+                if len(rows) >= CSV_BATCH_SIZE:
+                    writer.writerows(rows)
+                    rows.clear()
+        writer.writerows(rows)
 
-def _write_message_row(writer, ch_name, ch_type, msg, is_reply=False, parent_id=""):
-    """Write a single message row to CSV."""
+
+def _message_row(ch_name, ch_type, msg, is_reply=False, parent_id=""):
+    """Build a single message row for the CSV."""
     content = msg.get("content", msg.get("text", ""))
     text = extract_text(content)
 
-    reactions = msg.get("reactions", [])
-    reactions_str = json.dumps(reactions) if reactions else ""
+    # Most messages have neither reactions nor attachments; skip the
+    # serialization work for those
+    reactions = msg.get("reactions")
+    reactions_str = dump_json(reactions).decode("utf-8") if reactions else ""
 
-    attachments = msg.get("attachments", [])
-    attachment_str = ""
-    if attachments:
-        att_names = [a.get("name", a.get("url", "")) for a in attachments]
-        attachment_str = "; ".join(att_names)
+    attachments = msg.get("attachments")
+    attachment_str = (
+        "; ".join([a.get("name", a.get("url", "")) for a in attachments])
+        if attachments else ""
+    )
 
-    writer.writerow([
+    return (
         ch_name,
         ch_type,
         msg.get("id", ""),
@@ -557,14 +793,198 @@ def _write_message_row(writer, ch_name, ch_type, msg, is_reply=False, parent_id=
         parent_id,
         reactions_str,
         attachment_str,
-    ])
+    )
+
+
+# ─── Resume Checkpoints ──────────────────────────────────────────────────────
+
+def load_checkpoint(spool_dir, workspace_id):
+    """Load the resume state of an unfinished backup, or start a fresh one.
+
+    The checkpoint is a JSON Lines log: a header naming the workspace, then
+    one record per channel update, where the last record for a channel wins.
+    It is compacted to each channel's latest state on load.
+    """
+    path = os.path.join(spool_dir, CHECKPOINT_FILE)
+    checkpoint = {"workspace_id": workspace_id, "channels": {}}
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            header, *updates = f.read().splitlines()
+        if load_json(header).get("workspace_id") == workspace_id:
+            for line in updates:
+                try:
+                    state = load_json(line)
+                except ValueError:
+                    break  # torn last record of an interrupted run
+                checkpoint["channels"][state.pop("channel_id")] = state
+
+    with open(path + ".tmp", "wb") as f:
+        f.write(dump_json({"workspace_id": workspace_id}) + b"\n")
+        f.writelines(
+            dump_json({"channel_id": ch_id, **state}) + b"\n"
+            for ch_id, state in checkpoint["channels"].items()
+        )
+    os.replace(path + ".tmp", path)
+    return checkpoint
+
+
+def update_checkpoint(spool_dir, checkpoint, channel_id, state):
+    """Record a channel's progress by appending it to the checkpoint log."""
+    checkpoint["channels"][channel_id] = state
+    with open(os.path.join(spool_dir, CHECKPOINT_FILE), "ab") as f:
+        f.write(dump_json({"channel_id": channel_id, **state}) + b"\n")
+
+
+def find_unfinished_backup(output_dir, workspace_name):
+    """Return the newest backup directory of the workspace that never finished."""
+    if not os.path.isdir(output_dir):
+        return None
+    prefix = f"{workspace_name}_"
+    candidates = sorted(
+        entry.path
+        for entry in os.scandir(output_dir)
+        if entry.is_dir()
+        and entry.name.startswith(prefix)
+        and re.fullmatch(r"\d{8}_\d{6}", entry.name[len(prefix):])
+        and os.path.isdir(os.path.join(entry.path, ".spool"))
+    )
+    return candidates[-1] if candidates else None
+
+
+# ─── Channel Backup ──────────────────────────────────────────────────────────
+
+async def fetch_channel(sem, workspace_id, ch, ch_name, member_names, member_emails,
+                        fetch_replies, pbar, spool_dir, checkpoint):
+    """Fetch one channel's messages (and thread replies) into its spool file.
+
+    Messages are written to <spool_dir>/<channel id>.jsonl page by page, and
+    the checkpoint is updated after every page so an interrupted backup can
+    pick up where it stopped. Returns the channel's export record without
+    its messages, the number of thread replies fetched, and whether every
+    page was fetched.
+    """
+    async with sem:
+        ch_type = ch.get("type", "unknown")
+        ch_id = ch.get("id", "")
+
+        state = checkpoint["channels"].get(ch_id, {})
+        message_count = state.get("message_count", 0)
+        reply_count = state.get("reply_count", 0)
+        record = {
+            "channel_id": ch_id,
+            "channel_name": ch_name,
+            "channel_type": ch_type,
+            "channel_info": ch,
+        }
+
+        done = True
+        if not state.get("done"):
+            fetched = message_count
+            user_cache = {}
+            # Pages wait here until their thread replies arrive, so reply
+            # fetches overlap with fetching the next pages
+            pending = deque()
+
+            with open(os.path.join(spool_dir, f"{ch_id}.jsonl"), "ab") as spool:
+                # Drop anything written after the last checkpoint; truncate()
+                # leaves the position at the old end, so move to the new one
+                spool.truncate(state.get("spool_size", 0))
+                spool.seek(0, os.SEEK_END)
+
+                def write_page(page, threaded, all_replies, next_cursor):
+                    nonlocal message_count, reply_count
+                    for replies in all_replies:
+                        if isinstance(replies, BaseException):
+                            raise replies
+                    for msg, replies in zip(threaded, all_replies):
+                        msg["replies"] = replies
+                        reply_count += len(replies)
+                    enrich_messages(page, member_names, member_emails, user_cache)
+                    spool.writelines(dump_json(msg) + b"\n" for msg in page)
+                    spool.flush()
+                    message_count += len(page)
+                    update_checkpoint(spool_dir, checkpoint, ch_id, {
+                        "next_cursor": next_cursor,
+                        "last_msg_id": page[-1].get("id"),
+                        "spool_size": spool.tell(),
+                        "message_count": message_count,
+                        "reply_count": reply_count,
+                        "done": next_cursor is None,
+                    })
+
+                failure = None
+                try:
+                    try:
+                        async for page, next_cursor in iter_channel_messages(
+                            workspace_id, ch_id, state.get("next_cursor"),
+                        ):
+                            fetched += len(page)
+                            pbar.set_postfix_str(f"{ch_name}: {fetched} messages")
+
+                            threaded = [msg for msg in page if get_reply_count(msg) > 0] if fetch_replies else []
+                            batch = asyncio.gather(*(
+                                get_message_replies(workspace_id, ch_id, msg.get("id", ""))
+                                for msg in threaded
+                            ), return_exceptions=True)
+                            pending.append((page, threaded, batch, next_cursor))
+                            while pending and pending[0][2].done():
+                                page, threaded, batch, next_cursor = pending[0]
+                                write_page(page, threaded, batch.result(), next_cursor)
+                                pending.popleft()
+                    except FetchError as e:
+                        failure = e
+
+                    # Write the pages still waiting for replies. A failed reply
+                    # batch stops the writes at its page, so the checkpoint
+                    # keeps that page's cursor for --resume
+                    try:
+                        while pending:
+                            page, threaded, batch, next_cursor = pending[0]
+                            write_page(page, threaded, await batch, next_cursor)
+                            pending.popleft()
+                    except FetchError as e:
+                        failure = failure or e
+                finally:
+                    # On failure or cancellation (e.g. Ctrl-C), stop the reply
+                    # fetches still in flight and collect their outcome
+                    for _, _, batch, _ in pending:
+                        batch.cancel()
+                    await asyncio.gather(*(batch for _, _, batch, _ in pending), return_exceptions=True)
+
+                if failure:
+                    tqdm.write(f"  {ch_name}: {failure}, backup of this conversation is incomplete")
+                    done = False
+
+                if done and not checkpoint["channels"].get(ch_id, {}).get("done"):
+                    # Pagination ended without a final page (empty channel,
+                    # or the last cursor led to an empty page)
+                    update_checkpoint(spool_dir, checkpoint, ch_id, {
+                        **checkpoint["channels"].get(ch_id, {}),
+                        "next_cursor": None,
+                        "spool_size": spool.tell(),
+                        "message_count": message_count,
+                        "reply_count": reply_count,
+                        "done": True,
+                    })
+
+        record["message_count"] = message_count
+        return record, reply_count, done
 
 
 # ─── Main ────────────────────────────────────────────────────────────────────
 
-def main():
-    global API_TOKEN
+def positive_int(value):
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
+def main():
     parser = argparse.ArgumentParser(
         description="Backup all ClickUp chat conversations (channels, DMs, threads)",
     )
@@ -596,6 +1016,27 @@ def main():
         "--output-dir",
         help="Custom output directory for backups",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the newest unfinished backup of the workspace instead of starting over",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write zstd-compressed .zst exports (requires the zstandard package)",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Hide progress bars and per-conversation output",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=positive_int,
+        default=RATE_LIMIT_PER_MINUTE,
+        help=f"Max API requests per minute (default: {RATE_LIMIT_PER_MINUTE})",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -604,32 +1045,79 @@ def main():
     print("=" * 60)
 
     # Resolve API token
-    if args.token:
-        API_TOKEN = args.token
-    if not API_TOKEN:
-        API_TOKEN = input("\nEnter your ClickUp API token: ").strip()
-    if not API_TOKEN:
+    token = args.token or API_TOKEN
+    if not token:
+        token = input("\nEnter your ClickUp API token: ").strip()
+    if not token:
         print("API token is required.")
         print("Set it via: --token, CLICKUP_API_TOKEN env var, or .env file")
         sys.exit(1)
+    set_api_token(token)
+
+    if args.compress and zstandard is None:
+        print("--compress requires the zstandard package: pip install zstandard")
+        sys.exit(1)
+
+    asyncio.run(run_backup(args))
+
 
+async def run_backup(args):
+    """Run the backup inside a single shared HTTP session."""
+    global SESSION, LIMITER, COMPRESS
+
+    LIMITER = AsyncLimiter(args.rate_limit, 60)
+    COMPRESS = args.compress
+
+    # One keep-alive connection pool for every request, so TCP/TLS
+    # handshakes are paid once per connection rather than once per call
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_SIZE,
+        limit_per_host=HTTP_POOL_SIZE,
+        keepalive_timeout=60,
+        ttl_dns_cache=300,
+    )
+    async with aiohttp.ClientSession(
+        headers=get_headers(),
+        # No total timeout: it would also count the time spent queued for a
+        # free pooled connection, so bursts of requests would time out
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30),
+        connector=connector,
+    ) as SESSION:
+        await backup_workspace(args)
+
+
+async def backup_workspace(args):
+    """Back up legacy chat views and all chat channels of one workspace."""
     # Output directory
     output_dir = args.output_dir or OUTPUT_DIR
 
     # Select workspace
-    workspace = select_workspace(args.workspace_id)
+    workspace = await select_workspace(args.workspace_id)
     workspace_id = workspace["id"]
     workspace_name = workspace["name"]
 
     # Resolve member names for DMs
     print("\nFetching workspace members...")
-    members = get_workspace_members(workspace_id)
-    print(f"Found {len(members)} member(s)")
-
-    # Create output directory
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = os.path.join(output_dir, f"{workspace_name}_{timestamp}")
-    os.makedirs(backup_dir, exist_ok=True)
+    member_names, member_emails = await get_workspace_members(workspace_id)
+    print(f"Found {len(member_names)} member(s)")
+
+    # Create output directory, or pick up an unfinished one
+    backup_dir = None
+    if args.resume:
+        backup_dir = find_unfinished_backup(output_dir, workspace_name)
+        if backup_dir:
+            print(f"\nResuming unfinished backup: {backup_dir}")
+        else:
+            print("\nNo unfinished backup found, starting a new one.")
+    if not backup_dir:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_dir = os.path.join(output_dir, f"{workspace_name}_{timestamp}")
+        os.makedirs(backup_dir, exist_ok=True)
+
+    # Fetched messages and resume state live here until the export is done
+    spool_dir = os.path.join(backup_dir, ".spool")
+    os.makedirs(spool_dir, exist_ok=True)
+    checkpoint = load_checkpoint(spool_dir, workspace_id)
 
     total_comments = 0
     total_messages = 0
@@ -645,12 +1133,16 @@ def main():
         print("Part 1: Scanning for legacy Chat Views...")
         print("-" * 60)
 
-        chat_views = find_all_chat_views(workspace_id)
+        chat_views = await find_all_chat_views(workspace_id)
         print(f"\nFound {len(chat_views)} chat view(s)")
 
-        for cv in chat_views:
-            print(f"\n  Backing up: {cv['view_name']} ({cv['location']})")
-            comments = get_chat_view_comments(cv["view_id"])
+        all_comments = await tqdm_asyncio.gather(
+            *(get_chat_view_comments(cv["view_id"]) for cv in chat_views),
+            desc="  Chat views", unit="view", disable=args.quiet,
+        )
+        for cv, comments in zip(chat_views, all_comments):
+            if not args.quiet:
+                print(f"  {cv['view_name']} ({cv['location']}): {len(comments)} comments")
             total_comments += len(comments)
             all_view_data.append({
                 "view_id": cv["view_id"],
@@ -669,13 +1161,18 @@ def main():
     print("Part 2: Fetching ALL conversations (Channels + DMs + Group DMs)...")
     print("-" * 60)
 
-    channels = get_all_channels(workspace_id)
+    channels = await get_all_channels(workspace_id)
 
-    # Categorize
-    ch_channels = [c for c in channels if c.get("type") == "CHANNEL"]
-    ch_dms = [c for c in channels if c.get("type") == "DM"]
-    ch_group_dms = [c for c in channels if c.get("type") == "GROUP_DM"]
-    ch_other = [c for c in channels if c.get("type") not in ("CHANNEL", "DM", "GROUP_DM")]
+    # Categorize, resolving each conversation's display name once up front
+    by_type = defaultdict(list)
+    channel_names = {}
+    for c in channels:
+        by_type[c.get("type", "unknown")].append(c)
+        channel_names[c.get("id", "")] = resolve_channel_name(c, member_names)
+    ch_channels = by_type.pop("CHANNEL", [])
+    ch_dms = by_type.pop("DM", [])
+    ch_group_dms = by_type.pop("GROUP_DM", [])
+    ch_other = [c for chs in by_type.values() for c in chs]
 
     print(f"\n  Channels:   {len(ch_channels)}")
     print(f"  DMs:        {len(ch_dms)}")
@@ -684,66 +1181,61 @@ def main():
         print(f"  Other:      {len(ch_other)}")
     print(f"  Total:      {len(channels)}")
 
-    all_channel_data = []
-    for idx, ch in enumerate(channels, 1):
-        ch_type = ch.get("type", "unknown")
-        ch_id = ch.get("id", "")
-        ch_name = resolve_channel_name(ch, members)
-
-        print(f"\n  [{idx}/{len(channels)}] {ch_name} (type: {ch_type})")
-
-        messages = get_channel_messages(workspace_id, ch_id)
-        total_messages += len(messages)
-
-        # Fetch thread replies for messages that have them
-        if fetch_replies:
-            for msg in messages:
-                reply_count = msg.get("reply_count", 0)
-                if isinstance(reply_count, str):
-                    reply_count = int(reply_count) if reply_count.isdigit() else 0
-                if reply_count > 0:
-                    msg_id = msg.get("id", "")
-                    replies = get_message_replies(workspace_id, ch_id, msg_id)
-                    msg["replies"] = replies
-                    total_replies += len(replies)
-                    if replies:
-                        print(f"      Thread: {len(replies)} replies on message {msg_id}")
-
-        # Enrich messages with user names before saving
-        enrich_messages(messages, members)
-
-        all_channel_data.append({
-            "channel_id": ch_id,
-            "channel_name": ch_name,
-            "channel_type": ch_type,
-            "channel_info": ch,
-            "message_count": len(messages),
-            "messages": messages,
-        })
-
-    # Save all together
-    if all_channel_data:
-        save_json(all_channel_data, os.path.join(backup_dir, "all_conversations.json"))
-        save_channels_csv(all_channel_data, os.path.join(backup_dir, "all_conversations.csv"))
+    # Spool each channel's messages to disk page by page, so only the pages
+    # currently in flight are held in memory
+    records = {}
+    unfinished = []
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    with tqdm(total=len(channels), desc="  Conversations", unit="conv", disable=args.quiet) as pbar:
+        for next_done in asyncio.as_completed([
+            fetch_channel(
+                sem, workspace_id, ch, channel_names[ch.get("id", "")],
+                member_names, member_emails, fetch_replies, pbar, spool_dir, checkpoint,
+            )
+            for ch in channels
+        ]):
+            ch_info, reply_count, done = await next_done
+            records[ch_info["channel_id"]] = ch_info
+            if not done:
+                unfinished.append(ch_info["channel_name"])
+            total_messages += ch_info["message_count"]
+            total_replies += reply_count
+
+            pbar.update(1)
+            if not args.quiet:
+                pbar.write(
+                    f"  {ch_info['channel_name']} ({ch_info['channel_type']}): "
+                    f"{ch_info['message_count']} messages, {reply_count} replies"
+                )
+
+    def spooled(chs):
+        for c in chs:
+            ch_id = c.get("id", "")
+            yield {**records[ch_id], "messages": iter_jsonl(os.path.join(spool_dir, f"{ch_id}.jsonl"))}
+
+    # Save all together, in the original channel order
+    if channels:
+        save_json_stream(spooled(channels), os.path.join(backup_dir, "all_conversations.json"), "messages")
+        save_channels_csv(spooled(channels), os.path.join(backup_dir, "all_conversations.csv"))
 
         # Also save separately by type for easier browsing
-        channels_only = [c for c in all_channel_data if c["channel_type"] == "CHANNEL"]
-        dms_only = [c for c in all_channel_data if c["channel_type"] == "DM"]
-        group_dms_only = [c for c in all_channel_data if c["channel_type"] == "GROUP_DM"]
-
-        if channels_only:
-            save_json(channels_only, os.path.join(backup_dir, "channels.json"))
-            save_channels_csv(channels_only, os.path.join(backup_dir, "channels.csv"))
-        if dms_only:
-            save_json(dms_only, os.path.join(backup_dir, "direct_messages.json"))
-            save_channels_csv(dms_only, os.path.join(backup_dir, "direct_messages.csv"))
-        if group_dms_only:
-            save_json(group_dms_only, os.path.join(backup_dir, "group_dms.json"))
-            save_channels_csv(group_dms_only, os.path.join(backup_dir, "group_dms.csv"))
+        if ch_channels:
+            save_json_stream(spooled(ch_channels), os.path.join(backup_dir, "channels.json"), "messages")
+            save_channels_csv(spooled(ch_channels), os.path.join(backup_dir, "channels.csv"))
+        if ch_dms:
+            save_json_stream(spooled(ch_dms), os.path.join(backup_dir, "direct_messages.json"), "messages")
+            save_channels_csv(spooled(ch_dms), os.path.join(backup_dir, "direct_messages.csv"))
+        if ch_group_dms:
+            save_json_stream(spooled(ch_group_dms), os.path.join(backup_dir, "group_dms.json"), "messages")
+            save_channels_csv(spooled(ch_group_dms), os.path.join(backup_dir, "group_dms.csv"))
+
+    # Keep the spool of a partial backup so --resume can finish it
+    if not unfinished:
+        shutil.rmtree(spool_dir)
 
     # ── Summary ──────────────────────────────────────────────────────────
     print("\n" + "=" * 60)
-    print("  Backup Complete!")
+    print("  Backup Incomplete!" if unfinished else "  Backup Complete!")
     print("=" * 60)
     print(f"  Workspace:       {workspace_name}")
     if not args.skip_legacy:
@@ -754,6 +1246,9 @@ def main():
     print(f"  Total Messages:  {total_messages}")
     print(f"  Thread Replies:  {total_replies}")
     print(f"  Backup Location: {backup_dir}")
+    if unfinished:
+        print(f"  Incomplete:      {len(unfinished)} conversation(s): {', '.join(unfinished)}")
+        print("  Rerun with --resume to fetch the missing messages.")
     print("=" * 60)
 
     summary = {
@@ -767,6 +1262,7 @@ def main():
         "group_dms_count": len(ch_group_dms),
         "total_messages": total_messages,
         "total_thread_replies": total_replies,
+        "compression": "zstd" if COMPRESS else None,
         "files": {
             "all_conversations": "all_conversations.json / .csv",
             "channels_only": "channels.json / .csv",
@@ -775,7 +1271,8 @@ def main():
             "chat_views": "chat_views.json / .csv (legacy)",
         },
     }
-    save_json(summary, os.path.join(backup_dir, "backup_summary.json"))
+    # The summary stays uncompressed so it can be read without tools
+    save_json(summary, os.path.join(backup_dir, "backup_summary.json"), compress=False)
 
 
 if __name__ == "__main__":